@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import logging
-import re
 
 from homeassistant import config_entries, core
 from homeassistant.helpers import device_registry as dr
@@ -20,14 +19,6 @@ _LOGGER = logging.getLogger(__name__)
 PLATFORMS: list[str] = ["sensor", "binary_sensor", "number"]
 
 
-def _slugify_pwa(value: str) -> str:
-    """Return a stable, HA-friendly slug for PWA strings."""
-    s = str(value or "").strip().lower()
-    s = re.sub(r"[^a-z0-9]+", "_", s)
-    s = re.sub(r"_+", "_", s).strip("_")
-    return s
-
-
 def _get_merged_entry_data(entry: config_entries.ConfigEntry) -> dict:
     """Merge entry.data + entry.options (options override data)."""
     merged = dict(entry.data)
@@ -112,9 +103,8 @@ async def async_setup_entry(hass: core.HomeAssistant, entry: config_entries.Conf
     # to "iQua <model> <pwa>" for a nicer UI prefix in entity names.
     try:
         kv = (coordinator.data or {}).get("kv") or {}
-        pwa_raw = kv.get("manufacturing_information.pwa")
         model_raw = kv.get("manufacturing_information.model") or kv.get("manufacturing_information.model_code")
-        pwa = _slugify_pwa(pwa_raw) if pwa_raw else None
+        pwa = coordinator.pwa_key
         model = str(model_raw).strip() if model_raw else None
 
         if pwa:
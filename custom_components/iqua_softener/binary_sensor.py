@@ -8,7 +8,7 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntityDescription,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -187,9 +187,10 @@ async def async_setup_entry(
     entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
-    cfg = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    domain_data = hass.data.get(DOMAIN, {})
+    cfg = domain_data.get(entry.entry_id)
     if cfg is None:
-        cfg = next(iter(hass.data.get(DOMAIN, {}).values()), None)
+        cfg = next(iter(domain_data.values()), None)
     if cfg is None:
         raise RuntimeError('iQua Softener coordinator not initialized')
     coordinator: IquaSoftenerCoordinator = cfg["coordinator"]
@@ -234,6 +235,9 @@ class IquaCoordinatorBinarySensor(CoordinatorEntity[IquaSoftenerCoordinator], Bi
         # Stable unique id per device
         self._attr_unique_id = f"{device_uuid}_{description.key}".lower()
         self._attr_has_entity_name = True
+        # Evaluated once per coordinator tick instead of on every state read.
+        self._attr_is_on = description.value_fn(coordinator)
+        self._last_written: Optional[tuple[bool, Optional[bool]]] = None
 
     @property
     def device_info(self) -> DeviceInfo:
@@ -256,6 +260,12 @@ class IquaCoordinatorBinarySensor(CoordinatorEntity[IquaSoftenerCoordinator], Bi
             configuration_url=f"https://app.myiquaapp.com/devices/{self._device_uuid}",
         )
 
-    @property
-    def is_on(self) -> Optional[bool]:
-        return self.entity_description.value_fn(self.coordinator)
\ No newline at end of file
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        self._attr_is_on = self.entity_description.value_fn(self.coordinator)
+        # Only write when the published state actually changed (same check as the sensors).
+        written = (self.available, self._attr_is_on)
+        if written == self._last_written:
+            return
+        self._last_written = written
+        self.async_write_ha_state()
\ No newline at end of file
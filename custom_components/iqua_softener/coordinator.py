@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import logging
+import re
+import sys
 import time
 import random
 from datetime import timedelta, datetime
@@ -9,6 +11,7 @@ from typing import Any, Dict, Optional, Tuple
 import requests
 
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.helpers.storage import Store
 from homeassistant.util import dt as dt_util
@@ -18,7 +21,11 @@ from .const import DOMAIN
 _LOGGER = logging.getLogger(__name__)
 
 def _to_float(val):
-    """Best-effort float conversion (handles strings with comma decimals)."""
+    """Best-effort float conversion (handles strings with comma decimals).
+
+    Used for the coordinator's own regeneration/usage calculations; sensor
+    values go through the more lenient ``parse_kv_float``.
+    """
     if val is None:
         return None
     if isinstance(val, (int, float)):
@@ -32,6 +39,77 @@ def _to_float(val):
         return None
 
 
+_KV_STRIP_TABLE = str.maketrans("", "", "%\u00a0 \t\r\n")
+# unit words seen in English/German payloads, e.g. "3.6 Days" or "3,6 Tage"
+_KV_UNIT_SUFFIXES = ("Days", "days", "Day", "day", "Tage", "Tag")
+_KV_NUMBER_RE = re.compile(r"[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?")
+
+
+def parse_kv_float(v: Any) -> Optional[float]:
+    """Parse numbers that might come as '3.6 Days', '3,6 Tage', '76.5%' etc.
+
+    This is the lenient parser used for sensor values (sensor.py imports it
+    directly); kv values are run through it once per refresh (see
+    ``IquaSoftenerCoordinator.kv_parsed``).
+    """
+    if v is None:
+        return None
+    # already numeric (bool is an int subclass but never a measurement)
+    if isinstance(v, float):
+        return v
+    if isinstance(v, int) and not isinstance(v, bool):
+        return float(v)
+    # single pass: drop whitespace (incl. non-breaking spaces) and '%'
+    s = str(v).translate(_KV_STRIP_TABLE)
+    # strip a trailing unit word from API/UI (only when the value doesn't end in a digit)
+    if s and not s[-1].isdigit():
+        for unit in _KV_UNIT_SUFFIXES:
+            if s.endswith(unit):
+                s = s[: -len(unit)]
+                break
+    # locale-aware normalization:
+    # - German style: 544.910,50 -> 544910.50
+    # - US style:     544,910.50 -> 544910.50
+    if "," in s and "." in s:
+        # whichever appears last is assumed to be the decimal separator
+        if s.rfind(",") > s.rfind("."):
+            # comma decimal, dot thousands
+            s = s.replace(".", "").replace(",", ".")
+        else:
+            # dot decimal, comma thousands
+            s = s.replace(",", "")
+    elif "," in s:
+        # comma decimal
+        s = s.replace(",", ".")
+    # validate up front instead of raising/catching in float() for non-numeric text
+    if _KV_NUMBER_RE.fullmatch(s) is None:
+        return None
+    return float(s)
+
+
+def _slugify_pwa(value: str) -> str:
+    """Return a stable, HA-friendly slug for PWA strings."""
+    s = str(value or "").strip().lower()
+    s = re.sub(r"[^a-z0-9]+", "_", s)
+    s = re.sub(r"_+", "_", s).strip("_")
+    return s
+
+
+def as_str(v: Any) -> Optional[str]:
+    if v is None:
+        return None
+    s = str(v).strip()
+    return s if s else None
+
+
+def _pwa_key_from_kv(kv: Dict[str, Any]) -> Optional[str]:
+    """Derive the slugified PWA (device serial) from parsed kv, if present."""
+    pwa_raw = kv.get("manufacturing_information.pwa")
+    if not pwa_raw:
+        return None
+    return _slugify_pwa(pwa_raw) or None
+
+
 _STORAGE_VERSION = 2
 _STORAGE_KEY_FMT = f"{DOMAIN}_baseline_{'{'}device_uuid{'}'}"
 
@@ -144,6 +222,8 @@ CANONICAL_KV_MAP: Dict[Tuple[str, str], str] = {
     ("miscellaneous", "regeneration_enabled"): "miscellaneous.regeneration_enabled",
     ("miscellaneous", "lockout_status"): "miscellaneous.lockout_status",
 }
+# Intern canonical keys so sensor lookups (which intern their keys too) match by identity.
+CANONICAL_KV_MAP = {k: sys.intern(v) for k, v in CANONICAL_KV_MAP.items()}
 
 
 def _normalize_group_key(group_key: str) -> str:
@@ -162,6 +242,17 @@ def _extract_item_value(item: Dict[str, Any]) -> Any:
     return None
 
 
+def _parse_row_values(day_keys: tuple[str, ...], values: Any) -> tuple[tuple[str, float], ...]:
+    """Parse one table row into (column_title, float) pairs, skipping unparsable cells."""
+    if not isinstance(values, list):
+        return ()
+    # one comprehension over map() instead of an explicit loop with per-item bookkeeping;
+    # pairs (not a dict) so columns with a repeated title are all kept, in column order
+    return tuple(
+        (day, f) for day, f in zip(day_keys, map(parse_kv_float, values)) if f is not None
+    )
+
+
 def _parse_tables(groups: list[Dict[str, Any]]) -> Dict[str, Any]:
     tables: Dict[str, Any] = {}
     for g in groups:
@@ -178,15 +269,42 @@ def _parse_tables(groups: list[Dict[str, Any]]) -> Dict[str, Any]:
             if item.get("type") != "table":
                 continue
 
-            table_key = _normalize_item_key(item.get("key", ""))
+            # table keys and row labels are interned to match the sensors' interned lookup keys
+            table_key = sys.intern(_normalize_item_key(item.get("key", "")))
             table = item.get("item_table") or {}
             if not isinstance(table, dict):
                 continue
 
+            # Shape is validated here once: column_titles/rows are always lists and
+            # rows_by_label/parsed_by_label are always dicts, so sensors can rely on plain lookups.
+            col_titles = table.get("column_titles")
+            if not isinstance(col_titles, list):
+                col_titles = []
+            rows = table.get("rows")
+            if not isinstance(rows, list):
+                rows = []
+            # Index rows by label once so sensors don't scan the row list on every update,
+            # and parse each row's values once so sensors only need to publish them.
+            # Parsed values live in their own map so the API rows are left untouched.
+            rows_by_label: Dict[str, Any] = {}
+            parsed_by_label: Dict[str, tuple[tuple[str, float], ...]] = {}
+            # Column titles (Sun..Sat) are shared by all rows: stringify them once per table.
+            # Interned so every refresh (and every published attribute dict) reuses the same key objects.
+            day_keys = tuple(sys.intern(str(day)) for day in col_titles)
+            for row in rows:
+                if isinstance(row, dict) and isinstance(row.get("label"), str):
+                    label = sys.intern(row["label"])
+                    if label in rows_by_label:
+                        continue
+                    rows_by_label[label] = row
+                    parsed_by_label[label] = _parse_row_values(day_keys, row.get("values"))
+
             tables[table_key] = {
                 "title": table.get("title"),
-                "column_titles": table.get("column_titles", []),
-                "rows": table.get("rows", []),
+                "column_titles": col_titles,
+                "rows": rows,
+                "rows_by_label": rows_by_label,
+                "parsed_by_label": parsed_by_label,
                 "group": gkey,
             }
     return tables
@@ -215,6 +333,8 @@ class IquaSoftenerCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
         self._email = email
         self._password = password
         self._device_uuid = device_uuid
+        # Entity unique_ids are lowercase; device identifiers keep the original case.
+        self.unique_id_prefix: str = device_uuid.lower()
         self._api_base_url = api_base_url.rstrip("/")
         self._user_agent = user_agent
         self._app_origin = app_origin
@@ -222,6 +342,18 @@ class IquaSoftenerCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
         self._access_token: Optional[str] = None
         self._session: Optional[requests.Session] = None
 
+        # Slugified PWA of the device, derived once per refresh (used for device naming).
+        self.pwa_key: Optional[str] = None
+        # Views of the latest payload, extracted once per refresh and shared by all entities:
+        # raw kv values, kv values parsed to float where possible, and usage tables.
+        self.kv: Dict[str, Any] = {}
+        self.kv_parsed: Dict[str, Any] = {}
+        self.tables: Dict[str, Any] = {}
+        # DeviceInfo shared by all sensors of this device, rebuilt only when (model, sw, pwa) changes.
+        self._configuration_url = f"https://app.myiquaapp.com/devices/{device_uuid}"
+        self._device_info_sig: Optional[Tuple[Any, ...]] = None
+        self.device_info: DeviceInfo = self._build_device_info(self.kv)
+
         # Persisted baseline for the lifelong treated-water counter at last regeneration.
         self._baseline_store = Store(hass, _STORAGE_VERSION, _STORAGE_KEY_FMT.format(device_uuid=device_uuid))
         self._baseline_loaded: bool = False
@@ -1215,11 +1347,47 @@ class IquaSoftenerCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
 
         return {"kv": kv, "tables": tables}
 
+    def _build_device_info(self, kv: Dict[str, Any]) -> DeviceInfo:
+        """Device card in HA: show model, sw_version, and PWA as serial_number."""
+        model = as_str(kv.get("manufacturing_information.model")) or "Softener"
+        sw = as_str(kv.get("manufacturing_information.base_software_version"))
+        pwa = as_str(kv.get("manufacturing_information.pwa"))
+        sig = (model, sw, pwa)
+        if sig == self._device_info_sig:
+            return self.device_info
+        self._device_info_sig = sig
+        # Device name (avoid UUID + avoid firmware in entity_id slug by using PWA)
+        # Example: "iQua Leycosoft Pro 9 (7383865)"
+        name = f"iQua {model} ({pwa})" if pwa else f"iQua {model}"
+        return DeviceInfo(
+            identifiers={(DOMAIN, self._device_uuid)},
+            name=name,
+            manufacturer="iQua / EcoWater",
+            model=model,
+            sw_version=sw,
+            serial_number=pwa,
+            configuration_url=self._configuration_url,
+        )
+
     async def _async_update_data(self) -> Dict[str, Any]:
         await self.async_load_baseline()
         try:
             data = await self.hass.async_add_executor_job(self._sync_update)
             await self._postprocess_calculations(data)
+            kv = data.get("kv")
+            if not isinstance(kv, dict):
+                kv = {}
+            self.pwa_key = _pwa_key_from_kv(kv)
+            # Parse every kv value once here so sensors only need a dict lookup.
+            kv_parsed: Dict[str, Any] = {}
+            parse = parse_kv_float  # local alias: avoids a global lookup per kv item
+            for k, v in kv.items():
+                f = parse(v)
+                kv_parsed[k] = v if f is None else f
+            self.kv = kv
+            self.kv_parsed = kv_parsed
+            self.tables = data.get("tables") or {}
+            self.device_info = self._build_device_info(kv)
             return data
         except UpdateFailed:
             raise
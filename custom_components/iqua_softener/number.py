@@ -181,14 +181,11 @@ async def async_setup_entry(
 
     if _get_opt_float(opts.get(CONF_RAW_HARDNESS_DH)) is None:
         # Prefer cloud hardness (same KV source used for treated capacity calculation) as initial default.
-        cfg = hass.data[DOMAIN][config_entry.entry_id]
         coordinator = cfg.get("coordinator")
         cloud_dh = None
         try:
-            if coordinator and getattr(coordinator, "data", None):
-                kv = coordinator.data.get("kv") or {}
-                if isinstance(kv, dict):
-                    cloud_dh = _cloud_hardness_dh_from_kv(kv)
+            if coordinator and coordinator.kv:
+                cloud_dh = _cloud_hardness_dh_from_kv(coordinator.kv)
         except Exception as err:
             _LOGGER.debug("Failed to derive cloud hardness default: %s", err)
 
@@ -1,10 +1,13 @@
 from __future__ import annotations
 import logging
+import sys
 import time
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 import math
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional
 from homeassistant import config_entries, core
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -41,7 +44,7 @@ from .const import (
     SODIUM_LIMIT_MG_L,
     EWMA_TAU_SECONDS,
 )
-from .coordinator import IquaSoftenerCoordinator
+from .coordinator import IquaSoftenerCoordinator, as_str, parse_kv_float
 _LOGGER = logging.getLogger(__name__)
 # Throttle repetitive "missing operating_capacity/hardness" debug logs (esp. during API throttling)
 _MISSING_CAP_LOG_TS: dict[str, float] = {}
@@ -109,7 +112,7 @@ def _house_total_liters(
         return None, None, "entity_not_found"
     if st.state in ("unknown", "unavailable", "none", ""):
         return None, None, "entity_unavailable"
-    raw = _to_float(st.state)
+    raw = parse_kv_float(st.state)
     if raw is None:
         return None, None, "not_numeric"
     factor_used: Optional[float] = None
@@ -129,11 +132,6 @@ def _house_total_liters(
         if factor_used is None:
             return None, None, "unknown_unit"
     return raw * factor_used, factor_used, "ok"
-def _as_str(v: Any) -> Optional[str]:
-    if v is None:
-        return None
-    s = str(v).strip()
-    return s if s else None
 def _to_datetime(v: Any) -> Any:
     """Parse iQua timestamps to timezone-aware datetime.
     Known format from Ease UI: '30/12/2025 21:38' (DD/MM/YYYY HH:MM).
@@ -142,69 +140,42 @@ def _to_datetime(v: Any) -> Any:
     if v is None:
         return None
     # Already a datetime?
-    try:
-        from datetime import datetime as _dt
-        if isinstance(v, _dt):
-            return dt_util.as_utc(dt_util.as_local(v))
-    except Exception:
-        pass
-    s = str(v).strip()
-    if not s:
+    if isinstance(v, datetime):
+        return dt_util.as_utc(dt_util.as_local(v))
+    s = as_str(v)
+    if s is None:
         return None
-    # Try ISO first (sometimes APIs change)
+    # The same timestamp string repeats across many polls; naive values are read in the HA
+    # time zone, so it is part of the cache key.
+    return _parse_datetime_str(s, dt_util.DEFAULT_TIME_ZONE)
+@lru_cache(maxsize=64)
+def _parse_datetime_str(s: str, tz: Any) -> Optional[datetime]:
+    # Observed Ease UI format split by hand (strptime is slow): DD/MM/YYYY HH:MM or DD.MM.YYYY HH:MM
+    date_part, _, time_part = s.partition(" ")
+    d = date_part.split("/" if "/" in date_part else ".")
+    t = time_part.split(":")
+    if len(d) == 3 and len(t) == 2 and len(d[2]) == 4 and all(x.isdigit() for x in (*d, *t)):
+        try:
+            return dt_util.as_utc(datetime(int(d[2]), int(d[1]), int(d[0]), int(t[0]), int(t[1]), tzinfo=tz))
+        except ValueError:
+            pass
+    # ISO (sometimes APIs change)
     try:
         dt = dt_util.parse_datetime(s)
         if dt is not None:
             return dt_util.as_utc(dt_util.as_local(dt))
     except Exception:
         pass
-    # DD/MM/YYYY HH:MM (observed)
+    # DD/MM/YYYY HH:MM (observed), for anything the split above rejected
     for fmt in ("%d/%m/%Y %H:%M", "%d.%m.%Y %H:%M"):
         try:
             dt = datetime.strptime(s, fmt)  # naive local time
             # Attach local timezone and convert to UTC
-            dt = dt.replace(tzinfo=dt_util.DEFAULT_TIME_ZONE)
+            dt = dt.replace(tzinfo=tz)
             return dt_util.as_utc(dt)
         except Exception:
             continue
     return None
-def _to_float(v: Any) -> Optional[float]:
-    """Parse numbers that might come as '3.6 Days', '3,6 Tage', '76.5%' etc."""
-    if v is None:
-        return None
-    s = str(v).strip()
-    # remove whitespace (incl. non-breaking spaces)
-    s = s.replace("\u00a0", " ").replace(" ", "")
-    # strip common suffixes/units/words from API/UI
-    for token in (
-        "%",
-        "Days",
-        "Day",
-        "Tage",
-        "Tag",
-        "days",
-        "day",
-    ):
-        s = s.replace(token, "")
-    s = s.strip()
-    # locale-aware normalization:
-    # - German style: 544.910,50 -> 544910.50
-    # - US style:     544,910.50 -> 544910.50
-    if "," in s and "." in s:
-        # whichever appears last is assumed to be the decimal separator
-        if s.rfind(",") > s.rfind("."):
-            # comma decimal, dot thousands
-            s = s.replace(".", "").replace(",", ".")
-        else:
-            # dot decimal, comma thousands
-            s = s.replace(",", "")
-    elif "," in s:
-        # comma decimal
-        s = s.replace(",", ".")
-    try:
-        return float(s)
-    except Exception:
-        return None
 def _first_numeric_by_key_fragment(
     kv: dict[str, Any],
     *fragments: str,
@@ -216,13 +187,13 @@ def _first_numeric_by_key_fragment(
     for k, v in kv.items():
         kl = str(k).lower()
         if any(f in kl for f in frags):
-            n = _to_float(v)
+            n = parse_kv_float(v)
             if n is not None:
                 return n
     return None
 def _percent_from_api(raw: Any) -> Optional[float]:
     """Some API values are scaled by 10 (e.g. 765 == 76.5%)."""
-    f = _to_float(raw)
+    f = parse_kv_float(raw)
     if f is None:
         return None
     # Common pattern: 0..1000 where 1000 == 100.0
@@ -237,8 +208,8 @@ def _percent_from_api(raw: Any) -> Optional[float]:
     return f
 def _treated_capacity_total_l(operating_capacity_grains: Any, hardness_grains: Any) -> Optional[float]:
     """Compute total treatable water in liters from capacity (grains) and hardness (grains/gal)."""
-    cap = _to_float(operating_capacity_grains)
-    hard = _to_float(hardness_grains)
+    cap = parse_kv_float(operating_capacity_grains)
+    hard = parse_kv_float(hardness_grains)
     if cap is None or hard is None or hard <= 0:
         return None
     # Many iQua endpoints expose hardness as ppm (mg/L CaCO3). Convert heuristically.
@@ -251,10 +222,44 @@ def _treated_capacity_total_l(operating_capacity_grains: Any, hardness_grains: A
 def _round(v: Optional[float], ndigits: int) -> Optional[float]:
     if v is None:
         return None
+    if isinstance(v, float):
+        return round(v, ndigits)
     try:
         return round(float(v), ndigits)
     except Exception:
         return v
+def _make_kv_extractor(
+    kv_key: str, round_digits: Optional[int], transform: Optional[Callable[[Any], Any]]
+) -> Callable[[Dict[str, Any]], Any]:
+    """Build a kv sensor's reader once: kv lookup, optional transform, optional rounding."""
+    if transform is None and round_digits is None:
+        def _plain(kv: Dict[str, Any]) -> Any:
+            return kv.get(kv_key)
+        return _plain
+    if transform is None:
+        def _rounded(kv: Dict[str, Any]) -> Any:
+            val = kv.get(kv_key)
+            # parsed kv numbers are floats: round inline and keep _round() for the odd int
+            if isinstance(val, float):
+                return round(val, round_digits)
+            if isinstance(val, int):
+                return _round(val, round_digits)
+            return val
+        return _rounded
+    def _transformed(kv: Dict[str, Any]) -> Any:
+        val = kv.get(kv_key)
+        if val is None:
+            return None
+        # kv transforms (_percent_from_api, _salt_monitor_to_percent) return None instead of raising
+        val = transform(val)
+        if round_digits is None:
+            return val
+        if isinstance(val, float):
+            return round(val, round_digits)
+        if isinstance(val, int):
+            return _round(val, round_digits)
+        return val
+    return _transformed
 def _kv_first_value(
     kv: Dict[str, Any],
     *,
@@ -268,27 +273,27 @@ def _kv_first_value(
       2) key endswith any suffix (case-insensitive)
       3) key contains any substring (case-insensitive)
     """
-    if not isinstance(kv, dict):
-        return None
+    # kv is always a dict (coordinator.kv)
     # 1) Exact keys
     for k in exact_keys:
-        if k in kv and kv.get(k) is not None:
-            return kv.get(k)
+        v = kv.get(k)
+        if v is not None:
+            return v
     if not (suffixes or contains):
         return None
-    # Prepare lowercase view once
-    kv_items = list(kv.items())
-    for raw_k, raw_v in kv_items:
+    # Lowercase the patterns once, not per kv item
+    suffixes_l = tuple(str(suf).lower() for suf in suffixes)
+    contains_l = tuple(str(sub).lower() for sub in contains)
+    for raw_k, raw_v in kv.items():
         if raw_v is None:
             continue
         lk = str(raw_k).lower()
         # 2) Suffix match
-        for suf in suffixes:
-            if lk.endswith(str(suf).lower()):
-                return raw_v
+        if suffixes_l and lk.endswith(suffixes_l):
+            return raw_v
         # 3) Contains match
-        for sub in contains:
-            if str(sub).lower() in lk:
+        for sub in contains_l:
+            if sub in lk:
                 return raw_v
     return None
 # ---------- EWMA (Exponential Moving Average) helpers ----------
@@ -317,14 +322,18 @@ def _ewma_update(state: dict[str, Any], x: float, now_ts: float, tau_seconds: fl
     return new_val
 def _salt_monitor_to_percent(raw: Any) -> Optional[float]:
     """Salt monitor level seems 0..50 where 50 == 100%."""
-    f = _to_float(raw)
+    f = parse_kv_float(raw)
     if f is None:
         return None
-    f = max(0.0, min(50.0, f))
-    return (f / 50.0) * 100.0
+    # clamp to 0..50 and scale by 2 (same result as (f / 50) * 100, without the divide)
+    if f <= 0.0:
+        return 0.0
+    if f < 50.0:
+        return f * 2.0
+    return 100.0
 def _parse_iso_datetime(value: Any) -> Optional[datetime]:
     """Parse ISO string into aware datetime."""
-    s = _as_str(value)
+    s = as_str(value)
     if not s:
         return None
     try:
@@ -339,7 +348,12 @@ def _parse_iso_datetime(value: Any) -> Optional[datetime]:
 # ---------- Base classes ----------
 class IquaBaseSensor(SensorEntity, CoordinatorEntity[IquaSoftenerCoordinator], ABC):
     """Base sensor using translations (has_entity_name=True)."""
+    # HA's Entity bases keep a __dict__ (for _attr_*); we slot only the fields we add.
+    __slots__ = ("_device_uuid", "_last_data", "_last_written")
     _attr_has_entity_name = True
+    # Sensors that only read coordinator data can skip recomputing when the payload object
+    # is unchanged (e.g. a failed refresh keeps the previous data).
+    _recompute_on_same_data = False
     def __init__(
         self,
         coordinator: IquaSoftenerCoordinator,
@@ -350,92 +364,72 @@ class IquaBaseSensor(SensorEntity, CoordinatorEntity[IquaSoftenerCoordinator], A
         self.entity_description = description
         self._device_uuid = device_uuid
         # stable unique id per device
-        self._attr_unique_id = f"{device_uuid}_{description.key}".lower()
+        self._attr_unique_id = f"{coordinator.unique_id_prefix}_{description.key}"
+        self._last_data: Any = None
+        # (available, native_value, attributes) as of the last state write
+        self._last_written: Optional[tuple[Any, ...]] = None
     @property
     def device_info(self) -> DeviceInfo:
-        """Device card in HA: show model, sw_version, and PWA as serial_number."""
-        data = self.coordinator.data or {}
-        kv = data.get("kv", {}) if isinstance(data, dict) else {}
-        model = _as_str(kv.get("manufacturing_information.model")) or "Softener"
-        sw = _as_str(kv.get("manufacturing_information.base_software_version"))
-        pwa = _as_str(kv.get("manufacturing_information.pwa"))
-        # Device name (avoid UUID + avoid firmware in entity_id slug by using PWA)
-        # Example: "iQua Leycosoft Pro 9 (7383865)"
-        name = f"iQua {model} ({pwa})" if pwa else f"iQua {model}"
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._device_uuid)},
-            name=name,
-            manufacturer="iQua / EcoWater",
-            model=model,
-            sw_version=sw,
-            serial_number=pwa,
-            configuration_url=f"https://app.myiquaapp.com/devices/{self._device_uuid}",
-        )
+        """Device card in HA (built once per model/sw/PWA change by the coordinator)."""
+        return self.coordinator.device_info
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        # The first refresh runs before platform setup: take the value from it once here so
+        # the initial state written by HA isn't "unknown" until the next poll.
+        # Derived sensors recompute on every tick (and some restore state first), so skip them.
+        data = self.coordinator.data
+        if isinstance(data, dict) and not self._recompute_on_same_data:
+            self._last_data = data
+            self.update_from_data(data)
     @callback
     def _handle_coordinator_update(self) -> None:
-        self.update_from_data(self.coordinator.data or {})
+        data = self.coordinator.data or {}
+        if data is not self._last_data or self._recompute_on_same_data:
+            self._last_data = data
+            self.update_from_data(data)
+        # Skip no-op writes so the state machine/recorder don't see an identical state every poll.
+        # Attributes are copied because some sensors refill the same dict in place.
+        attrs = getattr(self, "_attr_extra_state_attributes", None)
+        written = (self.available, self._attr_native_value, dict(attrs) if attrs else None)
+        if written == self._last_written:
+            return
+        self._last_written = written
         self.async_write_ha_state()
     @abstractmethod
     def update_from_data(self, data: Dict[str, Any]) -> None:
         ...
 class IquaKVSensor(IquaBaseSensor):
-    """Reads a canonical kv key from coordinator.data['kv'][canonical_key]."""
+    """Reads a canonical kv key from coordinator.kv_parsed[canonical_key]."""
+    __slots__ = ("_k", "_extract")
     def __init__(
         self,
         coordinator: IquaSoftenerCoordinator,
         device_uuid: str,
-        description: SensorEntityDescription,
-        canonical_kv_key: str,
-        *,
-        round_digits: Optional[int] = None,
-        transform=None,
+        description: IquaKVSensorEntityDescription,
     ) -> None:
         super().__init__(coordinator, device_uuid, description)
-        self._k = canonical_kv_key
-        self._round_digits = round_digits
-        self._transform = transform
+        # interned: kv lookups can match by identity when the coordinator's key is interned too
+        self._k = sys.intern(description.kv_key)
+        # key/transform/rounding are fixed per sensor: specialise the reader once
+        self._extract = _make_kv_extractor(self._k, description.round_digits, description.transform)
     def update_from_data(self, data: Dict[str, Any]) -> None:
-        kv = data.get("kv", {})
-        if not isinstance(kv, dict):
-            self._attr_native_value = None
-            return
-        raw = kv.get(self._k)
-        if raw is None:
-            self._attr_native_value = None
-            return
-        # numeric if possible else keep string
-        val: Any
-        f = _to_float(raw)
-        val = f if f is not None else raw
-        if self._transform is not None:
-            try:
-                val = self._transform(val)
-            except Exception:
-                pass
-        if isinstance(val, (int, float)) and self._round_digits is not None:
-            val = _round(float(val), self._round_digits)
-        self._attr_native_value = val
+        # Values are parsed once per refresh by the coordinator (numeric if possible else raw)
+        self._attr_native_value = self._extract(self.coordinator.kv_parsed)
 class IquaTimestampSensor(IquaBaseSensor):
     """Timestamp sensor: value must be datetime."""
+    __slots__ = ("_k", "_transform")
     def __init__(
         self,
         coordinator: IquaSoftenerCoordinator,
         device_uuid: str,
-        description: SensorEntityDescription,
-        canonical_kv_key: str,
-        *,
-        transform=None,
+        description: IquaKVSensorEntityDescription,
     ) -> None:
         super().__init__(coordinator, device_uuid, description)
-        self._k = canonical_kv_key
+        self._k = sys.intern(description.kv_key)
         # Default parser handles both ISO 8601 and iQua formats like '30/12/2025 21:38'
-        self._transform = transform or _to_datetime
+        self._transform = description.transform or _to_datetime
     def update_from_data(self, data: Dict[str, Any]) -> None:
-        kv = data.get("kv", {})
-        if not isinstance(kv, dict):
-            self._attr_native_value = None
-            return
-        raw = kv.get(self._k)
+        raw = self.coordinator.kv.get(self._k)
         try:
             dt = self._transform(raw)
         except Exception:
@@ -443,25 +437,18 @@ class IquaTimestampSensor(IquaBaseSensor):
         self._attr_native_value = dt
 class IquaCalculatedCapacitySensor(IquaBaseSensor):
     """Calculated capacities in liters based on operating capacity and hardness."""
+    __slots__ = ("_mode", "_round_digits")
     def __init__(
         self,
         coordinator: IquaSoftenerCoordinator,
         device_uuid: str,
-        description: SensorEntityDescription,
-        *,
-        mode: str,
-        round_digits: int = 0,
+        description: IquaCalculatedCapacitySensorEntityDescription,
     ) -> None:
         super().__init__(coordinator, device_uuid, description)
-        self._mode = mode  # "total" or "remaining"
-        self._round_digits = round_digits
-        # Initialize value from the first coordinator payload
-        self.update_from_data(coordinator.data or {})
+        self._mode = description.mode  # "total", "remaining" or "remaining_percent"
+        self._round_digits = description.round_digits
     def update_from_data(self, data: Dict[str, Any]) -> None:
-        kv = data.get("kv", {})
-        if not isinstance(kv, dict):
-            self._attr_native_value = None
-            return
+        kv = self.coordinator.kv
         op_cap_raw = _kv_first_value(
             kv,
             exact_keys=(
@@ -580,80 +567,55 @@ class IquaCalculatedCapacitySensor(IquaBaseSensor):
                     return
                 val = total_l * (pct / 100.0)
         self._attr_native_value = _round(val, self._round_digits)
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Recompute values whenever the coordinator updates."""
-        self.update_from_data(self.coordinator.data or {})
-        self.async_write_ha_state()
 class IquaUsagePatternSensor(IquaBaseSensor):
     """
     Weekly table row:
       - state: weekly average (Liters)
       - attrs: Sun..Sat floats
     """
+    __slots__ = ("_table_key", "_row_label", "_round_digits", "_attrs_buf")
     def __init__(
         self,
         coordinator: IquaSoftenerCoordinator,
         device_uuid: str,
-        description: SensorEntityDescription,
-        table_key: str,
-        row_label: str,
-        *,
-        round_digits: int = 1,
+        description: IquaUsagePatternSensorEntityDescription,
     ) -> None:
         super().__init__(coordinator, device_uuid, description)
-        self._table_key = table_key
-        self._row_label = row_label
-        self._round_digits = round_digits
+        # interned like the coordinator's table keys and row labels
+        self._table_key = sys.intern(description.table_key)
+        self._row_label = sys.intern(description.row_label)
+        self._round_digits = description.round_digits
+        # Reused across refreshes instead of building a new attributes dict each time
+        self._attrs_buf: Dict[str, Any] = {}
     def update_from_data(self, data: Dict[str, Any]) -> None:
-        tables = data.get("tables", {})
-        if not isinstance(tables, dict):
-            self._attr_native_value = None
-            self._attr_extra_state_attributes = {}
-            return
-        table = tables.get(self._table_key)
-        if not isinstance(table, dict):
-            self._attr_native_value = None
-            self._attr_extra_state_attributes = {}
-            return
-        col_titles = table.get("column_titles", [])
-        rows = table.get("rows", [])
-        if not isinstance(col_titles, list) or not isinstance(rows, list):
-            self._attr_native_value = None
-            self._attr_extra_state_attributes = {}
-            return
-        row = next(
-            (r for r in rows if isinstance(r, dict) and r.get("label") == self._row_label),
-            None,
-        )
-        if not row:
+        # Table shape, row index and parsed values are guaranteed by the coordinator
+        table = self.coordinator.tables.get(self._table_key)
+        pairs = table["parsed_by_label"].get(self._row_label) if table else None
+        buf = self._attrs_buf
+        buf.clear()
+        self._attr_extra_state_attributes = buf
+        if pairs is None:
             self._attr_native_value = None
-            self._attr_extra_state_attributes = {}
             return
-        values = row.get("values", [])
-        if not isinstance(values, list):
-            self._attr_native_value = None
-            self._attr_extra_state_attributes = {}
-            return
-        attrs: Dict[str, Any] = {}
-        nums: list[float] = []
-        for i, day in enumerate(col_titles):
-            if i >= len(values):
-                break
-            f = _to_float(values[i])
-            if f is None:
-                continue
-            f = _round(f, self._round_digits)
-            attrs[str(day)] = f
-            nums.append(f)
-        self._attr_extra_state_attributes = attrs
-        self._attr_native_value = _round(sum(nums) / len(nums), self._round_digits) if nums else None
+        # Parsed values are always floats, so the builtin round() is enough (no _round guards)
+        rd = self._round_digits
+        # Single-pass mean over the rounded values, so the state matches the published attributes
+        total = 0.0
+        count = 0
+        for day, f in pairs:
+            f = round(f, rd)
+            buf[day] = f
+            total += f
+            count += 1
+        self._attr_native_value = round(total / count, rd) if count else None
 # ---------- Derived calculations (optional) ----------
 class IquaDerivedBaseSensor(IquaBaseSensor):
     """Base for sensors that derive values from HA state + iQua data.
     These sensors are optional and will return None (-> unavailable) if
     required inputs are not configured or not valid.
     """
+    # Inputs also come from other HA entities, so recompute on every tick.
+    _recompute_on_same_data = True
     def __init__(
         self,
         coordinator: IquaSoftenerCoordinator,
@@ -690,12 +652,7 @@ class IquaDerivedBaseSensor(IquaBaseSensor):
         return v
     def _read_soft_total_l(self) -> Optional[float]:
         # iQua already reports treated water total in liters
-        data = self.coordinator.data or {}
-        kv = data.get("kv", {}) if isinstance(data, dict) else {}
-        if not isinstance(kv, dict):
-            return None
-        v = kv.get("water_usage.treated_water")
-        return _to_float(v)
+        return parse_kv_float(self.coordinator.kv.get("water_usage.treated_water"))
     def _read_hardness_inputs(self) -> tuple[Optional[float], Optional[float], Optional[str]]:
         """Read hardness inputs.
         - raw hardness is required (°dH)
@@ -1240,15 +1197,516 @@ class IquaSoftenedFractionDailySensor(IquaDerivedBaseSensor):
             "house_today_corrected_l": _round(house_today, 1) if house_today is not None else None,
             "regen_self_consumption_l": _round(float(self._regen_self_consumption_l), 1),
         }
+# ---------- Entity descriptions ----------
+@dataclass(frozen=True, kw_only=True)
+class IquaKVSensorEntityDescription(SensorEntityDescription):
+    """Description for a sensor that reads one canonical kv key."""
+    kv_key: str
+    round_digits: Optional[int] = None
+    # Must not raise: return None for values it cannot handle.
+    transform: Optional[Callable[[Any], Any]] = None
+@dataclass(frozen=True, kw_only=True)
+class IquaUsagePatternSensorEntityDescription(SensorEntityDescription):
+    """Description for a sensor that reads one row of a weekly usage table."""
+    table_key: str
+    row_label: str
+    round_digits: int = 1
+@dataclass(frozen=True, kw_only=True)
+class IquaCalculatedCapacitySensorEntityDescription(SensorEntityDescription):
+    """Description for a capacity sensor calculated from operating capacity and hardness."""
+    mode: str
+    round_digits: int = 0
+# Common unit/state-class bundles shared by many descriptions below.
+_WATER_TOTAL_L: dict[str, Any] = {
+    "device_class": SensorDeviceClass.WATER,
+    "native_unit_of_measurement": UnitOfVolume.LITERS,
+    "state_class": SensorStateClass.TOTAL_INCREASING,
+}
+_LITERS_MEASUREMENT: dict[str, Any] = {
+    "native_unit_of_measurement": UnitOfVolume.LITERS,
+    "state_class": SensorStateClass.MEASUREMENT,
+}
+_PERCENT_MEASUREMENT: dict[str, Any] = {
+    "native_unit_of_measurement": PERCENTAGE,
+    "state_class": SensorStateClass.MEASUREMENT,
+}
+_KG_TOTAL: dict[str, Any] = {
+    "native_unit_of_measurement": UnitOfMass.KILOGRAMS,
+    "state_class": SensorStateClass.TOTAL_INCREASING,
+}
+_KG_MEASUREMENT: dict[str, Any] = {
+    "native_unit_of_measurement": UnitOfMass.KILOGRAMS,
+    "state_class": SensorStateClass.MEASUREMENT,
+}
+# Descriptions are immutable and shared across config entries (built once at import).
+TIMESTAMP_SENSORS: tuple[IquaKVSensorEntityDescription, ...] = (
+    # ================== Customer / Metadata ==================
+    IquaKVSensorEntityDescription(
+        key="last_message_received",
+        translation_key="last_message_received",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        icon="mdi:message-processing-outline",
+        kv_key="customer.time_message_received",
+        transform=_to_datetime,
+    ),
+)
+CALCULATED_CAPACITY_SENSORS: tuple[IquaCalculatedCapacitySensorEntityDescription, ...] = (
+    # --- Calculated remaining capacity (liters) ---
+    IquaCalculatedCapacitySensorEntityDescription(
+        key="calculated_treated_capacity_remaining_l",
+        translation_key="calculated_treated_capacity_remaining_l",
+        **_LITERS_MEASUREMENT,
+        icon="mdi:water-check",
+        mode="remaining",
+    ),
+    # --- Calculated remaining capacity (percent) ---
+    IquaCalculatedCapacitySensorEntityDescription(
+        key="calculated_treated_capacity_remaining_percent",
+        translation_key="calculated_treated_capacity_remaining_percent",
+        **_PERCENT_MEASUREMENT,
+        icon="mdi:water-percent",
+        mode="remaining_percent",
+        round_digits=1,
+    ),
+    IquaCalculatedCapacitySensorEntityDescription(
+        key="calculated_treated_capacity_total_l",
+        translation_key="calculated_treated_capacity_total_l",
+        **_LITERS_MEASUREMENT,
+        icon="mdi:water",
+        mode="total",
+    ),
+)
+KV_SENSORS: tuple[IquaKVSensorEntityDescription, ...] = (
+    # ================== Capacity ==================
+    IquaKVSensorEntityDescription(
+        key="capacity_remaining_percent",
+        translation_key="capacity_remaining_percent",
+        entity_registry_enabled_default=False,
+        **_PERCENT_MEASUREMENT,
+        kv_key="capacity.capacity_remaining_percent",
+        transform=_percent_from_api,
+        round_digits=1,
+    ),
+    IquaKVSensorEntityDescription(
+        key="average_capacity_remaining_at_regen_percent",
+        translation_key="average_capacity_remaining_at_regen_percent",
+        entity_registry_enabled_default=True,
+        **_PERCENT_MEASUREMENT,
+        kv_key="capacity.average_capacity_remaining_at_regen_percent",
+        round_digits=1,
+    ),
+    # ================== Water usage ==================
+    IquaKVSensorEntityDescription(
+        key="treated_water_total_l",
+        translation_key="treated_water_total_l",
+        **_WATER_TOTAL_L,
+        kv_key="water_usage.treated_water",
+        round_digits=1,
+    ),
+    IquaKVSensorEntityDescription(
+        key="untreated_water_total_l",
+        translation_key="untreated_water_total_l",
+        entity_registry_enabled_default=False,
+        **_WATER_TOTAL_L,
+        kv_key="water_usage.untreated_water",
+        round_digits=1,
+    ),
+    IquaKVSensorEntityDescription(
+        key="water_today_l",
+        translation_key="water_today_l",
+        **_LITERS_MEASUREMENT,
+        kv_key="water_usage.water_today",
+        round_digits=1,
+    ),
+    IquaKVSensorEntityDescription(
+        key="average_daily_use_l",
+        translation_key="average_daily_use_l",
+        entity_registry_enabled_default=True,
+        **_LITERS_MEASUREMENT,
+        kv_key="water_usage.average_daily_use",
+        round_digits=1,
+    ),
+    IquaKVSensorEntityDescription(
+        key="water_totalizer_l",
+        translation_key="water_totalizer_l",
+        **_WATER_TOTAL_L,
+        kv_key="water_usage.water_totalizer",
+        round_digits=1,
+    ),
+    IquaKVSensorEntityDescription(
+        key="treated_water_available_l",
+        translation_key="treated_water_available_l",
+        entity_registry_enabled_default=False,
+        **_LITERS_MEASUREMENT,
+        kv_key="water_usage.treated_water_left",
+        round_digits=1,
+    ),
+    # ================== Derived (local, persisted) ==================
+    IquaKVSensorEntityDescription(
+        key="calculated_days_since_last_regen_days",
+        translation_key="calculated_days_since_last_regen_days",
+        native_unit_of_measurement=UnitOfTime.DAYS,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:calendar-clock",
+        kv_key="calculated.days_since_last_regen_days",
+        round_digits=2,
+    ),
+    IquaKVSensorEntityDescription(
+        key="calculated_average_daily_use_l",
+        translation_key="calculated_average_daily_use_l",
+        **_LITERS_MEASUREMENT,
+        icon="mdi:water-sync",
+        kv_key="calculated.average_daily_use_l",
+        round_digits=1,
+    ),
+    IquaKVSensorEntityDescription(
+        key="calculated_average_days_between_regen_days",
+        translation_key="calculated_average_days_between_regen_days",
+        native_unit_of_measurement=UnitOfTime.DAYS,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:calendar-refresh",
+        kv_key="calculated.average_days_between_regen_days",
+        round_digits=2,
+    ),
+    IquaKVSensorEntityDescription(
+        key="current_flow_lpm",
+        translation_key="current_flow_lpm",
+        native_unit_of_measurement=VOLUME_FLOW_RATE_LITERS_PER_MINUTE,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:water-pump",
+        kv_key="water_usage.current_flow_rate",
+        round_digits=1,
+    ),
+    IquaKVSensorEntityDescription(
+        key="peak_flow_lpm",
+        translation_key="peak_flow_lpm",
+        native_unit_of_measurement=VOLUME_FLOW_RATE_LITERS_PER_MINUTE,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:chart-line",
+        kv_key="water_usage.peak_flow",
+        round_digits=1,
+    ),
+    # ================== Salt usage ==================
+    IquaKVSensorEntityDescription(
+        key="salt_total_kg",
+        translation_key="salt_total_kg",
+        **_KG_TOTAL,
+        kv_key="salt_usage.salt_total",
+        round_digits=2,
+    ),
+    IquaKVSensorEntityDescription(
+        key="total_salt_efficiency_ppm_per_kg",
+        translation_key="total_salt_efficiency_ppm_per_kg",
+        entity_registry_enabled_default=True,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:chart-bell-curve",
+        suggested_display_precision=0,
+        kv_key="salt_usage.total_salt_efficiency",
+        round_digits=0,
+    ),
+    IquaKVSensorEntityDescription(
+        key="salt_monitor_percent",
+        translation_key="salt_monitor_percent",
+        **_PERCENT_MEASUREMENT,
+        suggested_display_precision=0,
+        kv_key="salt_usage.salt_monitor_level",
+        transform=_salt_monitor_to_percent,
+        round_digits=0,
+    ),
+    IquaKVSensorEntityDescription(
+        key="out_of_salt_days",
+        translation_key="out_of_salt_days",
+        entity_registry_enabled_default=True,
+        native_unit_of_measurement="d",
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:calendar-clock",
+        suggested_display_precision=0,
+        kv_key="salt_usage.out_of_salt_days",
+        round_digits=0,
+    ),
+    IquaKVSensorEntityDescription(
+        key="average_salt_dose_per_recharge_kg",
+        translation_key="average_salt_dose_per_recharge_kg",
+        entity_registry_enabled_default=True,
+        **_KG_MEASUREMENT,
+        suggested_display_precision=3,
+        kv_key="salt_usage.average_salt_dose_per_recharge",
+        round_digits=3,
+    ),
+    # ================== Rock removed ==================
+    IquaKVSensorEntityDescription(
+        key="total_rock_removed_kg",
+        translation_key="total_rock_removed_kg",
+        **_KG_TOTAL,
+        suggested_display_precision=3,
+        kv_key="rock_removed.total_rock_removed",
+        round_digits=3,
+    ),
+    IquaKVSensorEntityDescription(
+        key="daily_average_rock_removed_kg",
+        translation_key="daily_average_rock_removed_kg",
+        **_KG_MEASUREMENT,
+        suggested_display_precision=3,
+        kv_key="rock_removed.daily_average_rock_removed",
+        round_digits=3,
+    ),
+    IquaKVSensorEntityDescription(
+        key="since_regen_rock_removed_kg",
+        translation_key="since_regen_rock_removed_kg",
+        **_KG_MEASUREMENT,
+        suggested_display_precision=3,
+        kv_key="rock_removed.since_regen_rock_removed",
+        round_digits=3,
+    ),
+    # ================== Regenerations ==================
+    IquaKVSensorEntityDescription(
+        key="time_in_operation_days",
+        translation_key="time_in_operation_days",
+        native_unit_of_measurement="d",
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:calendar",
+        suggested_display_precision=0,
+        kv_key="regenerations.time_in_operation_days",
+        round_digits=0,
+    ),
+    IquaKVSensorEntityDescription(
+        key="total_regens",
+        translation_key="total_regens",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        icon="mdi:counter",
+        suggested_display_precision=0,
+        kv_key="regenerations.total_regens",
+        round_digits=0,
+    ),
+    IquaKVSensorEntityDescription(
+        key="manual_regens",
+        translation_key="manual_regens",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        icon="mdi:waves-arrow-right",
+        suggested_display_precision=0,
+        kv_key="regenerations.manual_regens",
+        round_digits=0,
+    ),
+    IquaKVSensorEntityDescription(
+        key="second_backwash_cycles",
+        translation_key="second_backwash_cycles",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        icon="mdi:repeat",
+        suggested_display_precision=0,
+        kv_key="regenerations.second_backwash_cycles",
+        round_digits=0,
+    ),
+    IquaKVSensorEntityDescription(
+        key="time_since_last_recharge_days",
+        translation_key="time_since_last_recharge_days",
+        native_unit_of_measurement="d",
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:calendar-clock",
+        suggested_display_precision=0,
+        kv_key="regenerations.time_since_last_recharge_days",
+        round_digits=0,
+    ),
+    IquaKVSensorEntityDescription(
+        key="average_days_between_recharge_days",
+        translation_key="average_days_between_recharge_days",
+        entity_registry_enabled_default=True,
+        native_unit_of_measurement="d",
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:calendar-range",
+        suggested_display_precision=1,
+        kv_key="regenerations.average_days_between_recharge_days",
+        round_digits=1,
+    ),
+    # ================== Power outages ==================
+    IquaKVSensorEntityDescription(
+        key="total_power_outages",
+        translation_key="total_power_outages",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        icon="mdi:flash-alert",
+        suggested_display_precision=0,
+        kv_key="power_outages.total_power_outages",
+        round_digits=0,
+    ),
+    IquaKVSensorEntityDescription(
+        key="total_times_power_lost",
+        translation_key="total_times_power_lost",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        icon="mdi:flash",
+        suggested_display_precision=0,
+        kv_key="power_outages.total_times_power_lost",
+        round_digits=0,
+    ),
+    IquaKVSensorEntityDescription(
+        key="days_since_last_time_loss",
+        translation_key="days_since_last_time_loss",
+        native_unit_of_measurement="d",
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:calendar-clock",
+        suggested_display_precision=0,
+        kv_key="power_outages.days_since_last_time_loss",
+        round_digits=0,
+    ),
+    # longest_recorded_outage is a duration string -> keep as string
+    IquaKVSensorEntityDescription(
+        key="longest_recorded_outage",
+        translation_key="longest_recorded_outage",
+        icon="mdi:timer-outline",
+        kv_key="power_outages.longest_recorded_outage",
+    ),
+    # ================== Functional check ==================
+    IquaKVSensorEntityDescription(
+        key="functional_water_meter_sensor",
+        translation_key="functional_water_meter_sensor",
+        icon="mdi:water-check",
+        kv_key="functional_check.water_meter_sensor",
+    ),
+    IquaKVSensorEntityDescription(
+        key="functional_computer_board",
+        translation_key="functional_computer_board",
+        icon="mdi:cpu-64-bit",
+        kv_key="functional_check.computer_board",
+    ),
+    IquaKVSensorEntityDescription(
+        key="functional_cord_power_supply",
+        translation_key="functional_cord_power_supply",
+        icon="mdi:power-plug",
+        kv_key="functional_check.cord_power_supply",
+    ),
+    # ================== Misc ==================
+    IquaKVSensorEntityDescription(
+        key="misc_second_output",
+        translation_key="misc_second_output",
+        icon="mdi:information-outline",
+        kv_key="miscellaneous.second_output",
+    ),
+    IquaKVSensorEntityDescription(
+        key="misc_regeneration_enabled",
+        translation_key="misc_regeneration_enabled",
+        icon="mdi:check-circle-outline",
+        kv_key="miscellaneous.regeneration_enabled",
+    ),
+    IquaKVSensorEntityDescription(
+        key="misc_lockout_status",
+        translation_key="misc_lockout_status",
+        icon="mdi:lock-open-variant-outline",
+        kv_key="miscellaneous.lockout_status",
+    ),
+    # ================== Program settings ==================
+    IquaKVSensorEntityDescription(
+        key="controller_time",
+        translation_key="controller_time",
+        entity_registry_enabled_default=False,
+        icon="mdi:clock-outline",
+        kv_key="program.controller_time",
+    ),
+    IquaKVSensorEntityDescription(
+        key="regen_time_remaining",
+        translation_key="regen_time_remaining",
+        icon="mdi:timer-outline",
+        kv_key="program.regen_time_remaining",
+    ),
+)
+USAGE_PATTERN_SENSORS: tuple[IquaUsagePatternSensorEntityDescription, ...] = (
+    # ================== Water usage patterns (table) ==================
+    IquaUsagePatternSensorEntityDescription(
+        key="daily_water_usage_avg_pattern_l",
+        translation_key="daily_water_usage_avg_pattern_l",
+        **_LITERS_MEASUREMENT,
+        icon="mdi:calendar-week",
+        suggested_display_precision=1,
+        table_key="daily_water_usage_patterns",
+        row_label="Average Usage (Liters)",
+        round_digits=1,
+    ),
+    IquaUsagePatternSensorEntityDescription(
+        key="daily_water_usage_reserved_pattern_l",
+        translation_key="daily_water_usage_reserved_pattern_l",
+        entity_registry_enabled_default=True,
+        **_LITERS_MEASUREMENT,
+        icon="mdi:calendar-week",
+        suggested_display_precision=1,
+        table_key="daily_water_usage_patterns",
+        row_label="Reserved (Liters)",
+        round_digits=1,
+    ),
+)
+# Derived sensors depend on each other, so they are wired up individually in async_setup_entry.
+HOUSE_WATER_TOTAL_DESC = SensorEntityDescription(
+    key="house_water_total_l",
+    translation_key="house_water_total_l",
+    **_WATER_TOTAL_L,
+    icon="mdi:water",
+    entity_registry_enabled_default=True,
+)
+HOUSE_WATER_DAILY_DESC = SensorEntityDescription(
+    key="house_water_daily_l",
+    translation_key="house_water_daily_l",
+    **_LITERS_MEASUREMENT,
+    icon="mdi:water",
+    entity_registry_enabled_default=True,
+)
+SOFTENED_WATER_DAILY_DESC = SensorEntityDescription(
+    key="softened_water_daily_l",
+    translation_key="softened_water_daily_l",
+    **_LITERS_MEASUREMENT,
+    icon="mdi:water-check",
+    entity_registry_enabled_default=True,
+)
+DELTA_WATER_DAILY_DESC = SensorEntityDescription(
+    key="delta_water_daily_l",
+    translation_key="delta_water_daily_l",
+    **_LITERS_MEASUREMENT,
+    icon="mdi:water-minus",
+    entity_registry_enabled_default=True,
+)
+TREATED_HARDNESS_DAILY_DESC = SensorEntityDescription(
+    key="treated_hardness_daily_dh",
+    translation_key="treated_hardness_daily_dh",
+    native_unit_of_measurement="°dH",
+    state_class=SensorStateClass.MEASUREMENT,
+    icon="mdi:water-opacity",
+    entity_registry_enabled_default=True,
+)
+RAW_FRACTION_DAILY_DESC = SensorEntityDescription(
+    key="raw_fraction_daily_percent",
+    translation_key="raw_fraction_daily_percent",
+    **_PERCENT_MEASUREMENT,
+    icon="mdi:water-percent",
+    entity_registry_enabled_default=True,
+)
+SOFTENED_FRACTION_DAILY_DESC = SensorEntityDescription(
+    key="softened_fraction_daily_percent",
+    translation_key="softened_fraction_daily_percent",
+    **_PERCENT_MEASUREMENT,
+    icon="mdi:water-percent",
+    entity_registry_enabled_default=False,
+)
+EFFECTIVE_HARDNESS_SMOOTHED_DESC = SensorEntityDescription(
+    key="effective_hardness_smoothed_dh",
+    translation_key="effective_hardness_smoothed_dh",
+    native_unit_of_measurement="°dH",
+    state_class=SensorStateClass.MEASUREMENT,
+    icon="mdi:chart-bell-curve",
+    entity_registry_enabled_default=True,
+)
+EFFECTIVE_SODIUM_DESC = SensorEntityDescription(
+    key="effective_sodium_mg_l",
+    translation_key="effective_sodium_mg_l",
+    native_unit_of_measurement="mg/L",
+    state_class=SensorStateClass.MEASUREMENT,
+    icon="mdi:shaker-outline",
+    entity_registry_enabled_default=True,
+)
 async def async_setup_entry(
     hass: core.HomeAssistant,
     config_entry: config_entries.ConfigEntry,
     async_add_entities,
 ) -> None:
-    cfg = hass.data.get(DOMAIN, {}).get(config_entry.entry_id)
+    domain_data = hass.data.get(DOMAIN, {})
+    cfg = domain_data.get(config_entry.entry_id)
     if cfg is None:
         # Fallback: some HA reload paths may call platform setup before hass.data is populated
-        cfg = next(iter(hass.data.get(DOMAIN, {}).values()), None)
+        cfg = next(iter(domain_data.values()), None)
     if cfg is None:
         raise RuntimeError('iQua Softener coordinator not initialized')
     coordinator: IquaSoftenerCoordinator = cfg["coordinator"]
@@ -1262,619 +1720,34 @@ async def async_setup_entry(
     softened_hardness_dh = merged.get(CONF_SOFTENED_HARDNESS_DH)
     raw_sodium_mg_l = merged.get(CONF_RAW_SODIUM_MG_L, DEFAULT_RAW_SODIUM_MG_L)
     # Shared EWMA runtime state (in-memory). Smoothed sensor restores its last value on startup.
-    entry_runtime = hass.data.setdefault(DOMAIN, {}).setdefault(config_entry.entry_id, {})
+    entry_runtime = domain_data.setdefault(config_entry.entry_id, {})
     ewma_state = entry_runtime.setdefault("ewma", {}).setdefault("effective_hardness", {"value": None, "ts": None})
     # Provide a sensible default for raw hardness (user requested: 22.2 °dH).
     # Rest hardness remains optional; if missing/invalid, treated hardness calculation is disabled.
     if raw_hardness_dh in (None, ""):
         raw_hardness_dh = DEFAULT_RAW_HARDNESS_DH
     sensors: list[IquaBaseSensor] = [
-        # ================== Customer / Metadata ==================
-        IquaTimestampSensor(
-            coordinator,
-            device_uuid,
-            SensorEntityDescription(
-                key="last_message_received",
-                translation_key="last_message_received",
-                device_class=SensorDeviceClass.TIMESTAMP,
-                icon="mdi:message-processing-outline",
-            ),
-            "customer.time_message_received",
-            transform=_to_datetime,
-        ),
-        # ================== Capacity ==================
-        IquaKVSensor(
-            coordinator,
-            device_uuid,
-            SensorEntityDescription(
-                key="capacity_remaining_percent",
-                translation_key="capacity_remaining_percent",
-                entity_registry_enabled_default=False,
-                native_unit_of_measurement=PERCENTAGE,
-                state_class=SensorStateClass.MEASUREMENT,
-            ),
-            "capacity.capacity_remaining_percent",
-            transform=_percent_from_api,
-            round_digits=1,
-        ),
-        IquaKVSensor(
-            coordinator,
-            device_uuid,
-            SensorEntityDescription(
-                key="average_capacity_remaining_at_regen_percent",
-                translation_key="average_capacity_remaining_at_regen_percent",
-                entity_registry_enabled_default=True,
-                native_unit_of_measurement=PERCENTAGE,
-                state_class=SensorStateClass.MEASUREMENT,
-            ),
-            "capacity.average_capacity_remaining_at_regen_percent",
-            round_digits=1,
-        ),
-        # ================== Water usage ==================
-        IquaKVSensor(
-            coordinator,
-            device_uuid,
-            SensorEntityDescription(
-                key="treated_water_total_l",
-                translation_key="treated_water_total_l",
-                device_class=SensorDeviceClass.WATER,
-                native_unit_of_measurement=UnitOfVolume.LITERS,
-                state_class=SensorStateClass.TOTAL_INCREASING,
-            ),
-            "water_usage.treated_water",
-            round_digits=1,
-        ),
-        IquaKVSensor(
-            coordinator,
-            device_uuid,
-            SensorEntityDescription(
-                key="untreated_water_total_l",
-                translation_key="untreated_water_total_l",
-                entity_registry_enabled_default=False,
-                device_class=SensorDeviceClass.WATER,
-                native_unit_of_measurement=UnitOfVolume.LITERS,
-                state_class=SensorStateClass.TOTAL_INCREASING,
-            ),
-            "water_usage.untreated_water",
-            round_digits=1,
-        ),
-        IquaKVSensor(
-            coordinator,
-            device_uuid,
-            SensorEntityDescription(
-                key="water_today_l",
-                translation_key="water_today_l",
-                device_class=None,
-                native_unit_of_measurement=UnitOfVolume.LITERS,
-                state_class=SensorStateClass.MEASUREMENT,
-            ),
-            "water_usage.water_today",
-            round_digits=1,
-        ),
-        IquaKVSensor(
-            coordinator,
-            device_uuid,
-            SensorEntityDescription(
-                key="average_daily_use_l",
-                translation_key="average_daily_use_l",
-                entity_registry_enabled_default=True,
-                device_class=None,
-                native_unit_of_measurement=UnitOfVolume.LITERS,
-                state_class=SensorStateClass.MEASUREMENT,
-            ),
-            "water_usage.average_daily_use",
-            round_digits=1,
-        ),
-        IquaKVSensor(
-            coordinator,
-            device_uuid,
-            SensorEntityDescription(
-                key="water_totalizer_l",
-                translation_key="water_totalizer_l",
-                device_class=SensorDeviceClass.WATER,
-                native_unit_of_measurement=UnitOfVolume.LITERS,
-                state_class=SensorStateClass.TOTAL_INCREASING,
-            ),
-            "water_usage.water_totalizer",
-            round_digits=1,
-        ),
-        IquaKVSensor(
-            coordinator,
-            device_uuid,
-            SensorEntityDescription(
-                key="treated_water_available_l",
-                translation_key="treated_water_available_l",
-                entity_registry_enabled_default=False,
-                device_class=None,
-                native_unit_of_measurement=UnitOfVolume.LITERS,
-                state_class=SensorStateClass.MEASUREMENT,
-            ),
-            "water_usage.treated_water_left",
-            round_digits=1,
-        ),
-        # --- Calculated remaining capacity (liters) ---
-        IquaCalculatedCapacitySensor(
-            coordinator,
-            device_uuid,
-            SensorEntityDescription(
-                key="calculated_treated_capacity_remaining_l",
-                translation_key="calculated_treated_capacity_remaining_l",
-                native_unit_of_measurement=UnitOfVolume.LITERS,
-                state_class=SensorStateClass.MEASUREMENT,
-                icon="mdi:water-check",
-            ),
-            mode="remaining",
-        ),
-        # --- Calculated remaining capacity (percent) ---
-        IquaCalculatedCapacitySensor(
-            coordinator,
-            device_uuid,
-            SensorEntityDescription(
-                key="calculated_treated_capacity_remaining_percent",
-                translation_key="calculated_treated_capacity_remaining_percent",
-                native_unit_of_measurement=PERCENTAGE,
-                state_class=SensorStateClass.MEASUREMENT,
-                icon="mdi:water-percent",
-            ),
-            mode="remaining_percent",
-            round_digits=1,
-        ),
-        IquaCalculatedCapacitySensor(
-            coordinator,
-            device_uuid,
-            SensorEntityDescription(
-                key="calculated_treated_capacity_total_l",
-                translation_key="calculated_treated_capacity_total_l",
-                native_unit_of_measurement=UnitOfVolume.LITERS,
-                state_class=SensorStateClass.MEASUREMENT,
-                icon="mdi:water",
-            ),
-            mode="total",
-        ),
-# ================== Derived (local, persisted) ==================
-IquaKVSensor(
-    coordinator,
-    device_uuid,
-    SensorEntityDescription(
-        key="calculated_days_since_last_regen_days",
-        translation_key="calculated_days_since_last_regen_days",
-        native_unit_of_measurement=UnitOfTime.DAYS,
-        state_class=SensorStateClass.MEASUREMENT,
-        icon="mdi:calendar-clock",
-    ),
-    "calculated.days_since_last_regen_days",
-    round_digits=2,
-),
-IquaKVSensor(
-    coordinator,
-    device_uuid,
-    SensorEntityDescription(
-        key="calculated_average_daily_use_l",
-        translation_key="calculated_average_daily_use_l",
-        native_unit_of_measurement=UnitOfVolume.LITERS,
-        state_class=SensorStateClass.MEASUREMENT,
-        icon="mdi:water-sync",
-    ),
-    "calculated.average_daily_use_l",
-    round_digits=1,
-),
-IquaKVSensor(
-    coordinator,
-    device_uuid,
-    SensorEntityDescription(
-        key="calculated_average_days_between_regen_days",
-        translation_key="calculated_average_days_between_regen_days",
-        native_unit_of_measurement=UnitOfTime.DAYS,
-        state_class=SensorStateClass.MEASUREMENT,
-        icon="mdi:calendar-refresh",
-    ),
-    "calculated.average_days_between_regen_days",
-    round_digits=2,
-),
-        IquaKVSensor(
-            coordinator,
-            device_uuid,
-            SensorEntityDescription(
-                key="current_flow_lpm",
-                translation_key="current_flow_lpm",
-                native_unit_of_measurement=VOLUME_FLOW_RATE_LITERS_PER_MINUTE,
-                state_class=SensorStateClass.MEASUREMENT,
-                icon="mdi:water-pump",
-            ),
-            "water_usage.current_flow_rate",
-            round_digits=1,
-        ),
-        IquaKVSensor(
-            coordinator,
-            device_uuid,
-            SensorEntityDescription(
-                key="peak_flow_lpm",
-                translation_key="peak_flow_lpm",
-                native_unit_of_measurement=VOLUME_FLOW_RATE_LITERS_PER_MINUTE,
-                state_class=SensorStateClass.MEASUREMENT,
-                icon="mdi:chart-line",
-            ),
-            "water_usage.peak_flow",
-            round_digits=1,
-        ),
-        # ================== Water usage patterns (table) ==================
-        IquaUsagePatternSensor(
-            coordinator,
-            device_uuid,
-            SensorEntityDescription(
-                key="daily_water_usage_avg_pattern_l",
-                translation_key="daily_water_usage_avg_pattern_l",
-                device_class=None,
-                native_unit_of_measurement=UnitOfVolume.LITERS,
-                state_class=SensorStateClass.MEASUREMENT,
-                icon="mdi:calendar-week",
-                suggested_display_precision=1,
-            ),
-            table_key="daily_water_usage_patterns",
-            row_label="Average Usage (Liters)",
-            round_digits=1,
-        ),
-        IquaUsagePatternSensor(
-            coordinator,
-            device_uuid,
-            SensorEntityDescription(
-                key="daily_water_usage_reserved_pattern_l",
-                translation_key="daily_water_usage_reserved_pattern_l",
-                entity_registry_enabled_default=True,
-                device_class=None,
-                native_unit_of_measurement=UnitOfVolume.LITERS,
-                state_class=SensorStateClass.MEASUREMENT,
-                icon="mdi:calendar-week",
-                suggested_display_precision=1,
-            ),
-            table_key="daily_water_usage_patterns",
-            row_label="Reserved (Liters)",
-            round_digits=1,
-        ),
-        # ================== Salt usage ==================
-        IquaKVSensor(
-            coordinator,
-            device_uuid,
-            SensorEntityDescription(
-                key="salt_total_kg",
-                translation_key="salt_total_kg",
-                native_unit_of_measurement=UnitOfMass.KILOGRAMS,
-                state_class=SensorStateClass.TOTAL_INCREASING,
-            ),
-            "salt_usage.salt_total",
-            round_digits=2,
-        ),
-        IquaKVSensor(
-            coordinator,
-            device_uuid,
-            SensorEntityDescription(
-                key="total_salt_efficiency_ppm_per_kg",
-                translation_key="total_salt_efficiency_ppm_per_kg",
-                entity_registry_enabled_default=True,
-                state_class=SensorStateClass.MEASUREMENT,
-                icon="mdi:chart-bell-curve",
-                suggested_display_precision=0,
-            ),
-            "salt_usage.total_salt_efficiency",
-            round_digits=0,
-        ),
-        IquaKVSensor(
-            coordinator,
-            device_uuid,
-            SensorEntityDescription(
-                key="salt_monitor_percent",
-                translation_key="salt_monitor_percent",
-                native_unit_of_measurement=PERCENTAGE,
-                state_class=SensorStateClass.MEASUREMENT,
-                suggested_display_precision=0,
-            ),
-            "salt_usage.salt_monitor_level",
-            transform=_salt_monitor_to_percent,
-            round_digits=0,
-        ),
-        IquaKVSensor(
-            coordinator,
-            device_uuid,
-            SensorEntityDescription(
-                key="out_of_salt_days",
-                translation_key="out_of_salt_days",
-                entity_registry_enabled_default=True,
-                native_unit_of_measurement="d",
-                state_class=SensorStateClass.MEASUREMENT,
-                icon="mdi:calendar-clock",
-                suggested_display_precision=0,
-            ),
-            "salt_usage.out_of_salt_days",
-            round_digits=0,
-        ),
-        IquaKVSensor(
-            coordinator,
-            device_uuid,
-            SensorEntityDescription(
-                key="average_salt_dose_per_recharge_kg",
-                translation_key="average_salt_dose_per_recharge_kg",
-                entity_registry_enabled_default=True,
-                native_unit_of_measurement=UnitOfMass.KILOGRAMS,
-                state_class=SensorStateClass.MEASUREMENT,
-                suggested_display_precision=3,
-            ),
-            "salt_usage.average_salt_dose_per_recharge",
-            round_digits=3,
-        ),
-        # ================== Rock removed ==================
-        IquaKVSensor(
-            coordinator,
-            device_uuid,
-            SensorEntityDescription(
-                key="total_rock_removed_kg",
-                translation_key="total_rock_removed_kg",
-                native_unit_of_measurement=UnitOfMass.KILOGRAMS,
-                state_class=SensorStateClass.TOTAL_INCREASING,
-                suggested_display_precision=3,
-            ),
-            "rock_removed.total_rock_removed",
-            round_digits=3,
-        ),
-        IquaKVSensor(
-            coordinator,
-            device_uuid,
-            SensorEntityDescription(
-                key="daily_average_rock_removed_kg",
-                translation_key="daily_average_rock_removed_kg",
-                native_unit_of_measurement=UnitOfMass.KILOGRAMS,
-                state_class=SensorStateClass.MEASUREMENT,
-                suggested_display_precision=3,
-            ),
-            "rock_removed.daily_average_rock_removed",
-            round_digits=3,
-        ),
-        IquaKVSensor(
-            coordinator,
-            device_uuid,
-            SensorEntityDescription(
-                key="since_regen_rock_removed_kg",
-                translation_key="since_regen_rock_removed_kg",
-                native_unit_of_measurement=UnitOfMass.KILOGRAMS,
-                state_class=SensorStateClass.MEASUREMENT,
-                suggested_display_precision=3,
-            ),
-            "rock_removed.since_regen_rock_removed",
-            round_digits=3,
-        ),
-        # ================== Regenerations ==================
-        IquaKVSensor(
-            coordinator,
-            device_uuid,
-            SensorEntityDescription(
-                key="time_in_operation_days",
-                translation_key="time_in_operation_days",
-                native_unit_of_measurement="d",
-                state_class=SensorStateClass.MEASUREMENT,
-                icon="mdi:calendar",
-                suggested_display_precision=0,
-            ),
-            "regenerations.time_in_operation_days",
-            round_digits=0,
-        ),
-        IquaKVSensor(
-            coordinator,
-            device_uuid,
-            SensorEntityDescription(
-                key="total_regens",
-                translation_key="total_regens",
-                state_class=SensorStateClass.TOTAL_INCREASING,
-                icon="mdi:counter",
-                suggested_display_precision=0,
-            ),
-            "regenerations.total_regens",
-            round_digits=0,
-        ),
-        IquaKVSensor(
-            coordinator,
-            device_uuid,
-            SensorEntityDescription(
-                key="manual_regens",
-                translation_key="manual_regens",
-                state_class=SensorStateClass.TOTAL_INCREASING,
-                icon="mdi:waves-arrow-right",
-                suggested_display_precision=0,
-            ),
-            "regenerations.manual_regens",
-            round_digits=0,
-        ),
-        IquaKVSensor(
-            coordinator,
-            device_uuid,
-            SensorEntityDescription(
-                key="second_backwash_cycles",
-                translation_key="second_backwash_cycles",
-                state_class=SensorStateClass.TOTAL_INCREASING,
-                icon="mdi:repeat",
-                suggested_display_precision=0,
-            ),
-            "regenerations.second_backwash_cycles",
-            round_digits=0,
-        ),
-        IquaKVSensor(
-            coordinator,
-            device_uuid,
-            SensorEntityDescription(
-                key="time_since_last_recharge_days",
-                translation_key="time_since_last_recharge_days",
-                native_unit_of_measurement="d",
-                state_class=SensorStateClass.MEASUREMENT,
-                icon="mdi:calendar-clock",
-                suggested_display_precision=0,
-            ),
-            "regenerations.time_since_last_recharge_days",
-            round_digits=0,
-        ),
-        IquaKVSensor(
-            coordinator,
-            device_uuid,
-            SensorEntityDescription(
-                key="average_days_between_recharge_days",
-                translation_key="average_days_between_recharge_days",
-                entity_registry_enabled_default=True,
-                native_unit_of_measurement="d",
-                state_class=SensorStateClass.MEASUREMENT,
-                icon="mdi:calendar-range",
-                suggested_display_precision=1,
-            ),
-            "regenerations.average_days_between_recharge_days",
-            round_digits=1,
-        ),
-        # ================== Power outages ==================
-        IquaKVSensor(
-            coordinator,
-            device_uuid,
-            SensorEntityDescription(
-                key="total_power_outages",
-                translation_key="total_power_outages",
-                state_class=SensorStateClass.TOTAL_INCREASING,
-                icon="mdi:flash-alert",
-                suggested_display_precision=0,
-            ),
-            "power_outages.total_power_outages",
-            round_digits=0,
-        ),
-        IquaKVSensor(
-            coordinator,
-            device_uuid,
-            SensorEntityDescription(
-                key="total_times_power_lost",
-                translation_key="total_times_power_lost",
-                state_class=SensorStateClass.TOTAL_INCREASING,
-                icon="mdi:flash",
-                suggested_display_precision=0,
-            ),
-            "power_outages.total_times_power_lost",
-            round_digits=0,
-        ),
-        IquaKVSensor(
-            coordinator,
-            device_uuid,
-            SensorEntityDescription(
-                key="days_since_last_time_loss",
-                translation_key="days_since_last_time_loss",
-                native_unit_of_measurement="d",
-                state_class=SensorStateClass.MEASUREMENT,
-                icon="mdi:calendar-clock",
-                suggested_display_precision=0,
-            ),
-            "power_outages.days_since_last_time_loss",
-            round_digits=0,
-        ),
-        # longest_recorded_outage is a duration string -> keep as string
-        IquaKVSensor(
-            coordinator,
-            device_uuid,
-            SensorEntityDescription(
-                key="longest_recorded_outage",
-                translation_key="longest_recorded_outage",
-                icon="mdi:timer-outline",
-            ),
-            "power_outages.longest_recorded_outage",
-        ),
-        # ================== Functional check ==================
-        IquaKVSensor(
-            coordinator,
-            device_uuid,
-            SensorEntityDescription(
-                key="functional_water_meter_sensor",
-                translation_key="functional_water_meter_sensor",
-                icon="mdi:water-check",
-            ),
-            "functional_check.water_meter_sensor",
-        ),
-        IquaKVSensor(
-            coordinator,
-            device_uuid,
-            SensorEntityDescription(
-                key="functional_computer_board",
-                translation_key="functional_computer_board",
-                icon="mdi:cpu-64-bit",
-            ),
-            "functional_check.computer_board",
-        ),
-        IquaKVSensor(
-            coordinator,
-            device_uuid,
-            SensorEntityDescription(
-                key="functional_cord_power_supply",
-                translation_key="functional_cord_power_supply",
-                icon="mdi:power-plug",
-            ),
-            "functional_check.cord_power_supply",
-        ),
-        # ================== Misc ==================
-        IquaKVSensor(
-            coordinator,
-            device_uuid,
-            SensorEntityDescription(
-                key="misc_second_output",
-                translation_key="misc_second_output",
-                icon="mdi:information-outline",
-            ),
-            "miscellaneous.second_output",
-        ),
-        IquaKVSensor(
-            coordinator,
-            device_uuid,
-            SensorEntityDescription(
-                key="misc_regeneration_enabled",
-                translation_key="misc_regeneration_enabled",
-                icon="mdi:check-circle-outline",
-            ),
-            "miscellaneous.regeneration_enabled",
-        ),
-        IquaKVSensor(
-            coordinator,
-            device_uuid,
-            SensorEntityDescription(
-                key="misc_lockout_status",
-                translation_key="misc_lockout_status",
-                icon="mdi:lock-open-variant-outline",
-            ),
-            "miscellaneous.lockout_status",
-        ),
-        # ================== Program settings ==================
-        IquaKVSensor(
-            coordinator,
-            device_uuid,
-            SensorEntityDescription(
-                key="controller_time",
-                translation_key="controller_time",
-                entity_registry_enabled_default=False,
-                icon="mdi:clock-outline",
-            ),
-            "program.controller_time",
-        ),
-        IquaKVSensor(
-            coordinator,
-            device_uuid,
-            SensorEntityDescription(
-                key="regen_time_remaining",
-                translation_key="regen_time_remaining",
-                icon="mdi:timer-outline",
-            ),
-            "program.regen_time_remaining",
-        ),
+        IquaTimestampSensor(coordinator, device_uuid, description)
+        for description in TIMESTAMP_SENSORS
     ]
+    sensors.extend(
+        IquaCalculatedCapacitySensor(coordinator, device_uuid, description)
+        for description in CALCULATED_CAPACITY_SENSORS
+    )
+    sensors.extend(
+        IquaKVSensor(coordinator, device_uuid, description)
+        for description in KV_SENSORS
+    )
+    sensors.extend(
+        IquaUsagePatternSensor(coordinator, device_uuid, description)
+        for description in USAGE_PATTERN_SENSORS
+    )
     # ----- Optional derived sensors (delta + daily + treated hardness) -----
     # These sensors are always added, but will be unavailable unless inputs are configured.
     house_total_l_sensor = IquaHouseTotalLitersSensor(
         coordinator,
         device_uuid,
-        SensorEntityDescription(
-            key="house_water_total_l",
-            translation_key="house_water_total_l",
-            device_class=SensorDeviceClass.WATER,
-            native_unit_of_measurement=UnitOfVolume.LITERS,
-            state_class=SensorStateClass.TOTAL_INCREASING,
-            icon="mdi:water",
-            entity_registry_enabled_default=True,
-        ),
+        HOUSE_WATER_TOTAL_DESC,
         house_entity_id=house_entity_id,
         house_unit_mode=house_unit_mode,
         house_factor=house_factor,
@@ -1884,14 +1757,7 @@ IquaKVSensor(
     house_daily_l = IquaDailyCounterSensor(
         coordinator,
         device_uuid,
-        SensorEntityDescription(
-            key="house_water_daily_l",
-            translation_key="house_water_daily_l",
-            native_unit_of_measurement=UnitOfVolume.LITERS,
-            state_class=SensorStateClass.MEASUREMENT,
-            icon="mdi:water",
-            entity_registry_enabled_default=True,
-        ),
+        HOUSE_WATER_DAILY_DESC,
         house_entity_id=house_entity_id,
         house_unit_mode=house_unit_mode,
         house_factor=house_factor,
@@ -1902,14 +1768,7 @@ IquaKVSensor(
     softened_daily_l = IquaDailyCounterSensor(
         coordinator,
         device_uuid,
-        SensorEntityDescription(
-            key="softened_water_daily_l",
-            translation_key="softened_water_daily_l",
-            native_unit_of_measurement=UnitOfVolume.LITERS,
-            state_class=SensorStateClass.MEASUREMENT,
-            icon="mdi:water-check",
-            entity_registry_enabled_default=True,
-        ),
+        SOFTENED_WATER_DAILY_DESC,
         house_entity_id=house_entity_id,
         house_unit_mode=house_unit_mode,
         house_factor=house_factor,
@@ -1920,14 +1779,7 @@ IquaKVSensor(
     delta_daily_l = IquaDailyCounterSensor(
         coordinator,
         device_uuid,
-        SensorEntityDescription(
-            key="delta_water_daily_l",
-            translation_key="delta_water_daily_l",
-            native_unit_of_measurement=UnitOfVolume.LITERS,
-            state_class=SensorStateClass.MEASUREMENT,
-            icon="mdi:water-minus",
-            entity_registry_enabled_default=True,
-        ),
+        DELTA_WATER_DAILY_DESC,
         house_entity_id=house_entity_id,
         house_unit_mode=house_unit_mode,
         house_factor=house_factor,
@@ -1938,14 +1790,7 @@ IquaKVSensor(
     treated_hardness_daily = IquaTreatedHardnessDailySensor(
         coordinator,
         device_uuid,
-        SensorEntityDescription(
-            key="treated_hardness_daily_dh",
-            translation_key="treated_hardness_daily_dh",
-            native_unit_of_measurement="°dH",
-            state_class=SensorStateClass.MEASUREMENT,
-            icon="mdi:water-opacity",
-            entity_registry_enabled_default=True,
-        ),
+        TREATED_HARDNESS_DAILY_DESC,
         house_entity_id=house_entity_id,
         house_unit_mode=house_unit_mode,
         house_factor=house_factor,
@@ -1958,14 +1803,7 @@ IquaKVSensor(
     raw_fraction_daily = IquaRawFractionDailySensor(
         coordinator,
         device_uuid,
-        SensorEntityDescription(
-            key="raw_fraction_daily_percent",
-            translation_key="raw_fraction_daily_percent",
-            native_unit_of_measurement=PERCENTAGE,
-            state_class=SensorStateClass.MEASUREMENT,
-            icon="mdi:water-percent",
-            entity_registry_enabled_default=True,
-        ),
+        RAW_FRACTION_DAILY_DESC,
         house_entity_id=house_entity_id,
         house_unit_mode=house_unit_mode,
         house_factor=house_factor,
@@ -1978,14 +1816,7 @@ IquaKVSensor(
     softened_fraction_daily = IquaSoftenedFractionDailySensor(
         coordinator,
         device_uuid,
-        SensorEntityDescription(
-            key="softened_fraction_daily_percent",
-            translation_key="softened_fraction_daily_percent",
-            native_unit_of_measurement=PERCENTAGE,
-            state_class=SensorStateClass.MEASUREMENT,
-            icon="mdi:water-percent",
-            entity_registry_enabled_default=False,
-        ),
+        SOFTENED_FRACTION_DAILY_DESC,
         house_entity_id=house_entity_id,
         house_unit_mode=house_unit_mode,
         house_factor=house_factor,
@@ -1998,14 +1829,7 @@ IquaKVSensor(
     effective_hardness_smoothed = IquaEffectiveHardnessSmoothedSensor(
         coordinator,
         device_uuid,
-        SensorEntityDescription(
-            key="effective_hardness_smoothed_dh",
-            translation_key="effective_hardness_smoothed_dh",
-            native_unit_of_measurement="°dH",
-            state_class=SensorStateClass.MEASUREMENT,
-            icon="mdi:chart-bell-curve",
-            entity_registry_enabled_default=True,
-        ),
+        EFFECTIVE_HARDNESS_SMOOTHED_DESC,
         house_entity_id=house_entity_id,
         house_unit_mode=house_unit_mode,
         house_factor=house_factor,
@@ -2019,14 +1843,7 @@ IquaKVSensor(
     effective_sodium = IquaEffectiveSodiumSensor(
         coordinator,
         device_uuid,
-        SensorEntityDescription(
-            key="effective_sodium_mg_l",
-            translation_key="effective_sodium_mg_l",
-            native_unit_of_measurement="mg/L",
-            state_class=SensorStateClass.MEASUREMENT,
-            icon="mdi:shaker-outline",
-            entity_registry_enabled_default=True,
-        ),
+        EFFECTIVE_SODIUM_DESC,
         house_entity_id=house_entity_id,
         house_unit_mode=house_unit_mode,
         house_factor=house_factor,